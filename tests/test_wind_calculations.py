@@ -8,13 +8,22 @@ import pytest
 
 from wind_calculations import (
     annual_power_density,
+    annual_power_density_series,
     swept_area,
     power_kw,
+    turbine_power_kw,
     derated_annual_energy_output,
     annual_energy_output,
+    pipeline,
     possible_turbine_installations,
+    possible_turbine_installations_array,
+    make_turbine_counter,
+    possible_turbines_grid,
+    WindParams,
     air_density_lookup,
     wind_speed_lookup,
+    air_density_at,
+    wind_speed_at,
 )
 
 
@@ -39,15 +48,82 @@ def test_annual_power_density_known_values(wind_speed, air_density, epf, expecte
     assert result == expected
 
 
-def test_annual_power_density_rounds_wind_speed_to_2dp():
-    # Function rounds wind_speed to 2 decimals internally
+def test_annual_power_density_quantize_rounds_wind_speed_to_2dp():
+    # With quantize=True the function rounds wind_speed to 2 decimals first
     v_raw = 5.12345
     v = np.round(v_raw, 2)
     expected = np.rint(0.5 * 1.0 * 2.0 * (v ** 3))
-    result = annual_power_density(v_raw, 1.0, 2.0)
+    result = annual_power_density(v_raw, 1.0, 2.0, quantize=True)
     assert result == expected
 
 
+def test_annual_power_density_default_does_not_quantize():
+    # Default path uses the wind speed as given
+    v_raw = 5.12345
+    expected = np.rint(0.5 * 1.0 * 2.0 * (v_raw ** 3))
+    assert annual_power_density(v_raw, 1.0, 2.0) == expected
+
+
+def test_annual_power_density_accepts_arrays():
+    speeds = np.array([0.0, 4.47, 10.0])
+    result = annual_power_density(speeds, 1.0, 2.0)
+    expected = np.rint(1.0 * speeds ** 3)
+    assert isinstance(result, np.ndarray)
+    assert np.array_equal(result, expected)
+    # Array input must not be modified in place
+    assert np.array_equal(speeds, [0.0, 4.47, 10.0])
+
+
+def test_annual_power_density_array_dtype():
+    speeds = np.array([3.21, 5.12, 9.54])
+    # Batch default is float32 (halves bandwidth on big time series)
+    assert annual_power_density(speeds).dtype == np.float32
+    # Full precision on request, matching the float64 scalar path
+    full = annual_power_density(speeds, dtype=np.float64)
+    assert full.dtype == np.float64
+    for v, expected in zip(speeds, full):
+        assert annual_power_density(float(v)) == expected
+
+
+def test_annual_power_density_series_without_pandas():
+    # Plain array-likes come back as ndarray
+    speeds = [4.47, 9.54]
+    result = annual_power_density_series(speeds, 1.0, 2.0)
+    assert isinstance(result, np.ndarray)
+    assert np.array_equal(result, annual_power_density(np.asarray(speeds), 1.0, 2.0))
+
+
+def test_annual_power_density_series_rewraps_pandas_series():
+    pd = pytest.importorskip("pandas")
+    series = pd.Series([4.47, 9.54, 10.0], index=["a", "b", "c"])
+    result = annual_power_density_series(series, 1.0, 2.0)
+    assert isinstance(result, pd.Series)
+    assert list(result.index) == ["a", "b", "c"]
+    assert np.array_equal(result.to_numpy(),
+                          annual_power_density(series.to_numpy(), 1.0, 2.0))
+
+
+def test_annual_power_density_array_quantize():
+    speeds = np.array([5.12345, 9.876])
+    result = annual_power_density(speeds, 1.0, 2.0, quantize=True)
+    expected = np.rint(1.0 * np.round(speeds, 2) ** 3)
+    assert np.array_equal(result, expected)
+
+
+def test_annual_power_density_ties_round_half_to_even():
+    # 0.5 * 1.0 * 1.0 * 1.0^3 = 0.5 exactly: np.rint semantics -> 0,
+    # on every path (compiled scalar, compiled ufunc, NumPy fallback)
+    assert annual_power_density(1.0, 1.0, 1.0) == 0.0
+    assert np.array_equal(annual_power_density(np.array([1.0]), 1.0, 1.0), [0.0])
+
+
+def test_annual_power_density_array_matches_scalar():
+    speeds = np.array([3.21, 5.12345, 9.54])
+    vec = annual_power_density(speeds, dtype=np.float64)
+    for v, expected in zip(speeds, vec):
+        assert annual_power_density(float(v)) == expected
+
+
 @pytest.mark.parametrize(
     "diameter,expected",
     [
@@ -64,6 +140,17 @@ def test_swept_area_negative_diameter_matches_positive():
     assert np.isclose(swept_area(-100.0), swept_area(100.0))
 
 
+def test_swept_area_cache_and_array_variant_consistent():
+    from wind_calculations import swept_area_array
+
+    diameters = np.array([50.0, 100.0, 236.0])
+    areas = swept_area_array(diameters)
+    for d, a in zip(diameters, areas):
+        # Repeat calls hit the LRU cache and must agree with the array path
+        assert swept_area(float(d)) == a
+        assert swept_area(float(d)) == a
+
+
 @pytest.mark.parametrize(
     "power_density,diameter,expected",
     [
@@ -76,6 +163,38 @@ def test_power_kw_values(power_density, diameter, expected):
     assert int(power_kw(power_density, diameter)) == expected
 
 
+def test_turbine_power_kw_matches_unrounded_chain():
+    # Fused kernel rounds once at the end, so compare against the
+    # unrounded closed form 0.5 * rho * epf * v^3 * (pi/4) * d^2 / 1000
+    v, rho, epf, d = 9.54, 1.0, 1.91, 100.0
+    expected = np.rint(0.5 * rho * epf * v ** 3 * np.pi * (d / 2) ** 2 / 1000)
+    assert turbine_power_kw(v, rho, epf, d) == expected
+
+
+def test_turbine_power_kw_array_input():
+    speeds = np.array([0.0, 4.47, 10.0])
+    result = turbine_power_kw(speeds, 1.225, 1.91, 50.0)
+    expected = np.rint(0.5 * 1.225 * 1.91 * speeds ** 3 * np.pi * 625.0 / 1000)
+    assert isinstance(result, np.ndarray)
+    assert np.array_equal(result, expected)
+
+
+def test_power_kw_accepts_arrays():
+    densities = np.array([0.0, 104.0, 1000.0])
+    result = power_kw(densities, 100.0)
+    expected = np.rint(densities * np.pi * 2500.0 / 1000)
+    assert isinstance(result, np.ndarray)
+    assert np.array_equal(result, expected)
+
+
+def test_derated_annual_energy_output_accepts_arrays():
+    kws = np.array([0.0, 204.0, 2308.0])
+    result = derated_annual_energy_output(kws, 0.2)
+    expected = np.rint(kws * 8.76 * 0.2)
+    assert isinstance(result, np.ndarray)
+    assert np.array_equal(result, expected)
+
+
 @pytest.mark.parametrize(
     "kw,expected",
     [
@@ -142,6 +261,23 @@ def test_worked_example_reference_case():
     assert int(derated) == 357
 
 
+def test_pipeline_rounds_once_at_the_end():
+    v, rho, epf, d, eff = 4.47, 1.225, 1.91, 50.0, 0.20
+    raw = 0.5 * rho * epf * v ** 3 * np.pi * (d / 2) ** 2 / 1000 * 8.76 * eff
+    assert pipeline(v, rho, epf, d, eff) == round(raw)
+    # Close to, but not necessarily equal to, the step-by-step rounded chain
+    stepwise = derated_annual_energy_output(
+        power_kw(annual_power_density(v, rho, epf), d), eff)
+    assert abs(pipeline(v, rho, epf, d, eff) - stepwise) <= 3
+
+
+def test_pipeline_array_input():
+    speeds = np.array([4.47, 9.54])
+    result = pipeline(speeds, 1.225, 1.91, 50.0, 0.20)
+    for v, e in zip(speeds, result):
+        assert pipeline(float(v), 1.225, 1.91, 50.0, 0.20) == pytest.approx(e, abs=1)
+
+
 @pytest.mark.parametrize(
     "area_km2,diameter,spacing,expected",
     [
@@ -154,6 +290,47 @@ def test_possible_turbine_installations_values(area_km2, diameter, spacing, expe
     assert possible_turbine_installations(area_km2, diameter, spacing) == expected
 
 
+def test_make_turbine_counter_matches_scalar_function():
+    count = make_turbine_counter(50.0, 6.0)
+    # 8.1 is an exact-multiple boundary (8.1e6 / 90000 = 90): a
+    # reciprocal-multiply form lands just below 90 and truncates to 89
+    for area in (0.0, 1.0, 2.0, 8.1, 10.5):
+        assert count(area) == possible_turbine_installations(area, 50.0, 6.0)
+
+
+def test_possible_turbine_installations_array_matches_scalar():
+    areas = np.array([1.0, 2.0, 0.5])
+    result = possible_turbine_installations_array(areas, 50.0, 6.0)
+    assert result.dtype == np.int64
+    for area, n in zip(areas, result):
+        assert possible_turbine_installations(float(area), 50.0, 6.0) == n
+
+
+def test_possible_turbine_installations_array_fractional_density():
+    # Fractional spacing densities (non-integer sd*sd) are where float
+    # and truncated-integer arithmetic can drift apart by one turbine;
+    # 8.0688/23.2336/3.7822 is a known divergent triple
+    areas = np.array([8.0688, 1.0, 25.0])
+    for d, s in ((23.2336, 3.7822), (236.0, 5.98)):
+        result = possible_turbine_installations_array(areas, d, s)
+        for area, n in zip(areas, result):
+            assert possible_turbine_installations(float(area), d, s) == n
+
+
+def test_possible_turbines_grid_matches_scalar():
+    # Mix exact-integer spacing densities with fractional ones (5.98
+    # default, 23.2336 m rotor) to cover the truncation boundaries
+    areas = np.array([0.5, 1.0, 8.0688])
+    diameters = np.array([50.0, 23.2336])
+    spacings = np.array([6.0, 5.98, 3.7822])
+    grid = possible_turbines_grid(areas, diameters, spacings)
+    assert grid.shape == (3, 2, 3)
+    for i, a in enumerate(areas):
+        for j, d in enumerate(diameters):
+            for k, s in enumerate(spacings):
+                assert grid[i, j, k] == possible_turbine_installations(float(a), float(d), float(s))
+
+
 def test_possible_turbine_installations_zero_division_cases():
     # spacing_factor = 0 or rotor_diameter = 0 leads to division by zero in current implementation
     with pytest.raises(ZeroDivisionError):
@@ -210,6 +387,30 @@ def test_possible_turbines_monotonic_in_area(area_km2, delta):
     assert nt2 >= nt1
 
 
+def test_aot_kernels_match_public_api():
+    # Only runs when the AOT module has been built
+    # (python wind_calculations_aot.py)
+    kernels = pytest.importorskip("_wind_kernels")
+    assert kernels.apd_scalar(4.47, 1.225, 1.91) == annual_power_density(4.47, 1.225, 1.91)
+    speeds = np.array([3.21, 9.54])
+    assert np.array_equal(
+        kernels.apd_array(speeds, 1.225, 1.91),
+        annual_power_density(speeds, 1.225, 1.91, dtype=np.float64))
+
+
+def test_wind_params_bundle_matches_explicit_arguments():
+    p = WindParams(air_density=1.225, energy_pattern_factor=1.91, efficiency=0.2)
+    assert annual_power_density(4.47, params=p) == annual_power_density(4.47, 1.225, 1.91)
+    assert pipeline(4.47, diameter=50.0, params=p) == pipeline(4.47, 1.225, 1.91, 50.0, 0.2)
+
+
+def test_wind_params_is_frozen():
+    p = WindParams()
+    assert p.air_density == 0.990
+    with pytest.raises(AttributeError):
+        p.air_density = 1.0
+
+
 # --------------------------
 # Lookup table sanity checks
 # --------------------------
@@ -222,3 +423,14 @@ def test_lookup_tables_have_expected_keys():
 def test_lookup_values_are_positive():
     assert all(v > 0 for v in air_density_lookup.values())
     assert all(v > 0 for v in wind_speed_lookup.values())
+
+
+def test_array_lookups_match_dicts():
+    heights = np.array([100, 150, 200, 250])
+    assert np.array_equal(air_density_at(heights),
+                          [air_density_lookup[h] for h in heights])
+    assert np.array_equal(wind_speed_at(heights),
+                          [wind_speed_lookup[h] for h in heights])
+    # Scalar access works too
+    assert air_density_at(200) == air_density_lookup[200]
+    assert wind_speed_at(200) == wind_speed_lookup[200]
@@ -1,29 +1,133 @@
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+
 import numpy as np
 
+try:
+    from numba import njit, prange, vectorize
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        # Fallback: leave the decorated function as plain Python
+        def decorate(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return decorate
+
 
 # Lookup tables for air density and wind speed by height (rotor diameter)
 # Both tables are derived from von Krauland et al., 2023
-air_density_lookup = {
-    100: 1.000,
-    150: 0.995,
-    200: 0.990,
-    250: 0.986
-}
-wind_speed_lookup = {
-    100: 9.54,
-    150: 9.92,
-    200: 10.10,
-    250: 10.25
-}
-
-def annual_power_density(wind_speed: float, air_density: float = 0.990, energy_pattern_factor: float = 1.91) -> np.float64:
+# Stored as parallel sorted arrays so array-valued height columns can be
+# resolved with one searchsorted + gather instead of per-row dict access
+_HEIGHTS = np.array([100, 150, 200, 250], dtype=np.int32)
+_AIR_DENSITY = np.array([1.000, 0.995, 0.990, 0.986])
+_WIND_SPEED = np.array([9.54, 9.92, 10.10, 10.25])
+
+# Dict views kept for backward compatibility with existing callers
+air_density_lookup = dict(zip(_HEIGHTS.tolist(), _AIR_DENSITY.tolist()))
+wind_speed_lookup = dict(zip(_HEIGHTS.tolist(), _WIND_SPEED.tolist()))
+
+def air_density_at(heights):
+    """
+    Look up air density (kg/m³) for one or more heights in meters.
+
+    Heights must be among the tabulated values {100, 150, 200, 250}.
+    Array inputs resolve in a single searchsorted + fancy index.
+    """
+    return _AIR_DENSITY[np.searchsorted(_HEIGHTS, _np_asarray(heights))]
+
+def wind_speed_at(heights):
+    """
+    Look up mean wind speed (m/s) for one or more heights in meters.
+
+    Heights must be among the tabulated values {100, 150, 200, 250}.
+    Array inputs resolve in a single searchsorted + fancy index.
+    """
+    return _WIND_SPEED[np.searchsorted(_HEIGHTS, _np_asarray(heights))]
+
+# NumPy callables bound to module-level names at import, so hot bodies
+# skip the np.<attr> lookup on every call
+_np_ndim = np.ndim
+_np_asarray = np.asarray
+_np_round = np.round
+_np_rint = np.rint
+_np_multiply = np.multiply
+_np_empty_like = np.empty_like
+
+@dataclass(frozen=True, slots=True)
+class WindParams:
+    """
+    Bundle of the model parameters that are otherwise scattered across
+    function signatures. Frozen + slots keeps instances small, hashable
+    and cache-line friendly when sweeping many parameter sets.
+
+    Defaults match the module defaults (see README for sources).
+    """
+    air_density: float = 0.990
+    energy_pattern_factor: float = 1.91
+    efficiency: float = 0.20
+    hours_per_year: float = 8760.0
+    spacing_factor: float = 5.98
+
+
+# Constants hoisted out of the per-call bodies
+_QUARTER_PI = math.pi * 0.25
+_MWH_PER_KW_YEAR = 8760 / 1000.0  # hours per year / (W -> kW)
+
+@lru_cache(maxsize=32)
+def _apd_constant(air_density: float, energy_pattern_factor: float) -> float:
+    """Cached 0.5 * air_density * energy_pattern_factor.
+
+    Callers usually study one site, so one (rho, epf) pair repeats for
+    every call; the fold then costs a dict hit instead of two multiplies.
+    """
+    return 0.5 * air_density * energy_pattern_factor
+
+@njit(cache=True, fastmath=True)
+def _apd_scalar(wind_speed: float, air_density: float, energy_pattern_factor: float) -> float:
+    """JIT-compiled scalar kernel for annual_power_density."""
+    v2 = wind_speed * wind_speed
+    power_density = 0.5 * air_density * energy_pattern_factor * v2 * wind_speed
+    return np.rint(power_density)
+
+
+try:
+    # AOT-compiled kernels (build with: python wind_calculations_aot.py)
+    # take priority: same code, but no JIT warm-up on first call
+    from _wind_kernels import apd_scalar as _apd_scalar  # noqa: F811
+    from _wind_kernels import apd_array as _apd_array_aot
+    AOT_KERNELS = True
+except ImportError:
+    AOT_KERNELS = False
+
+
+if NUMBA_AVAILABLE:
+    # Compiled ufunc twin of _apd_scalar: releases the GIL and spreads
+    # large arrays across cores (caching is unsupported for this target)
+    @vectorize(['float32(float32, float32, float32)',
+                'float64(float64, float64, float64)'],
+               target='parallel', fastmath=True)
+    def _apd_ufunc(wind_speed, air_density, energy_pattern_factor):
+        v2 = wind_speed * wind_speed
+        return np.rint(0.5 * air_density * energy_pattern_factor * v2 * wind_speed)
+
+
+def annual_power_density(wind_speed, air_density: float = 0.990, energy_pattern_factor: float = 1.91, quantize: bool = False, dtype=np.float32, _round: bool = True, params: WindParams = None):
     """
     Calculate the annual average power density of wind.
 
+    Accepts either a single wind speed or an array of wind speeds (e.g. a
+    time series); array inputs are computed in one vectorized NumPy pass.
+
     Parameters:
     -----------
-    wind_speed : float
-        Mean wind speed in m/s (rounded to 2 decimal places)
+    wind_speed : float or array_like
+        Mean wind speed(s) in m/s
     air_density : float, optional
         Air density in kg/m³, default 0.990 (value at 200 m altitude).
         Other typical values:
@@ -37,67 +141,231 @@ def annual_power_density(wind_speed: float, air_density: float = 0.990, energy_p
         This is a measure of the wind speed distribution's effect on available power
         For Weibull distribution with shape parameter k=2 (Rayleigh distribution)
 
+    quantize : bool, optional
+        If True, round wind speed(s) to 2 decimal places before the
+        calculation (the historical behavior). Off by default; it is a
+        presentation nicety and costs a rounding pass per call.
+
+    dtype : numpy dtype, optional
+        Working precision for array inputs, default np.float32: wind
+        speeds carry ~3 significant figures, and float32 halves the
+        bytes moved on large (e.g. hourly, multi-decade) batches. Pass
+        np.float64 for full precision. Scalar inputs always compute in
+        float64 so reference cases stay bit-exact.
+
+    _round : bool, optional
+        If False, return the raw power density without rounding to the
+        nearest integer. Composed callers (see pipeline) use this to
+        round once at the end of a chain instead of at every step.
+
+    params : WindParams, optional
+        If given, air_density and energy_pattern_factor are taken from
+        the bundle instead of the individual keyword arguments.
+
     Returns:
     --------
-    np.float64
-        Annual average power density in W/m² (rounded to nearest integer)
+    np.float64 or np.ndarray
+        Annual average power density in W/m² (rounded to nearest integer).
+        Scalar in, scalar out; array in, array out.
     """
-    wind_speed = np.round(wind_speed, 2)
-    power_density = 0.5 * air_density * energy_pattern_factor * (wind_speed ** 3)
-    return np.rint(power_density)
+    if params is not None:
+        air_density = params.air_density
+        energy_pattern_factor = params.energy_pattern_factor
+    if _np_ndim(wind_speed) == 0:
+        v = float(wind_speed)
+        if quantize:
+            v = round(v * 100) * 0.01
+        if not _round:
+            return _apd_constant(air_density, energy_pattern_factor) * v * v * v
+        return _apd_scalar(v, air_density, energy_pattern_factor)
+    v = _np_asarray(wind_speed, dtype=dtype)
+    if quantize:
+        v = _np_round(v, 2)
+    if not _round:
+        return _apd_constant(air_density, energy_pattern_factor) * v * v * v
+    if NUMBA_AVAILABLE:
+        return _apd_ufunc(v, air_density, energy_pattern_factor)
+    if AOT_KERNELS:
+        out = _apd_array_aot(np.ascontiguousarray(v, dtype=np.float64),
+                             air_density, energy_pattern_factor)
+        return out.astype(dtype, copy=False)
+    out = _np_empty_like(v)
+    _np_multiply(v, v, out=out)
+    out *= v
+    out *= _apd_constant(air_density, energy_pattern_factor)
+    _np_rint(out, out=out)
+    return out
 
+def annual_power_density_series(wind_speed, air_density: float = 0.990, energy_pattern_factor: float = 1.91, dtype=np.float32):
+    """
+    annual_power_density for a pandas Series (or any array-like).
+
+    Calling series.apply(annual_power_density) pays Python dispatch per
+    row. This unwraps to a NumPy array, computes the whole column in one
+    vectorized pass, and rewraps the result with the original index.
+    pandas is not imported: anything without an .index attribute simply
+    comes back as a plain ndarray.
+
+    Parameters mirror annual_power_density.
+    """
+    values = _np_asarray(wind_speed, dtype=dtype)
+    out = annual_power_density(values, air_density, energy_pattern_factor, dtype=dtype)
+    # Series-like: has an index attribute (lists have an index *method*)
+    index = getattr(wind_speed, "index", None)
+    if index is not None and not callable(index):
+        return type(wind_speed)(out, index=index)
+    return out
+
+@njit(cache=True, fastmath=True)
+def _swept_area_scalar(diameter: float) -> float:
+    """JIT-compiled scalar kernel for swept_area."""
+    return _QUARTER_PI * diameter * diameter
+
+@lru_cache(maxsize=256)
 def swept_area(diameter: float) -> float:
     """
     Calculate the swept area of a wind turbine rotor.
-    
+
+    Results are memoized: turbine catalogues reuse a small set of
+    diameters, so repeat calls become a cache hit. For NumPy array
+    inputs (unhashable) use swept_area_array instead.
+
     Parameters:
     -----------
     diameter : float
         Rotor diameter in meters.
-    
+
     Returns:
     --------
     float
         Swept area in square meters (m²).
     """
-    return np.pi * (diameter / 2) ** 2
+    return _swept_area_scalar(diameter)
+
+def swept_area_array(diameter):
+    """
+    Vectorized swept_area for arrays of rotor diameters.
+
+    Parameters:
+    -----------
+    diameter : array_like
+        Rotor diameters in meters.
+
+    Returns:
+    --------
+    np.ndarray
+        Swept areas in square meters (m²).
+    """
+    d = _np_asarray(diameter, dtype=np.float64)
+    return _QUARTER_PI * d * d
+
+@njit(cache=True, fastmath=True)
+def _power_kw_scalar(power_density: float, rotor_diameter: float, _round: bool) -> float:
+    """JIT-compiled scalar kernel for power_kw."""
+    power = power_density * _swept_area_scalar(rotor_diameter) / 1000
+    if _round:
+        return np.rint(power)
+    return power
 
-def power_kw(power_density: float, rotor_diameter: float) -> float:
+def power_kw(power_density, rotor_diameter, _round: bool = True):
     """
     Calculate the total power output in kW given annual power density (W/m²) and rotor diameter.
     Uses the swept_area function to compute the rotor swept area.
 
+    Either argument may be an array; array inputs broadcast and are
+    computed in one vectorized pass.
+
     Parameters:
     -----------
-    power_density : float
+    power_density : float or array_like
         Annual power density in W/m².
-    rotor_diameter : float
+    rotor_diameter : float or array_like
         Rotor diameter in meters.
 
     Returns:
     --------
-    float
+    float or np.ndarray
         Total power output in kW, rounded to nearest integer.
 
     """
-    area = swept_area(rotor_diameter)
-    return np.rint((power_density * area) / 1000)
+    if _np_ndim(power_density) == 0 and _np_ndim(rotor_diameter) == 0:
+        return _power_kw_scalar(float(power_density), float(rotor_diameter), _round)
+    power = _np_asarray(power_density) * swept_area_array(rotor_diameter) / 1000
+    if _round:
+        return _np_rint(power)
+    return power
+
 
+# Fused constant for turbine_power_kw: 0.5 (kinetic energy) * pi/4 (swept
+# area from diameter) * 1/1000 (W -> kW), folded at import time
+_TURBINE_KW_CONST = 0.5 * np.pi * 0.25 / 1000.0
 
-def derated_annual_energy_output(power_kw: float, efficiency: float = 0.2) -> float:
+def turbine_power_kw(wind_speed, air_density: float = 0.990, energy_pattern_factor: float = 1.91, diameter: float = 236.0, dtype=np.float32, params: WindParams = None):
+    """
+    Calculate turbine power output in kW directly from wind speed.
+
+    Fuses annual_power_density, swept_area and power_kw into a single
+    expression, so chained callers avoid two intermediate arrays and the
+    intermediate rounding of the power density. Because only the final
+    result is rounded, values can differ by ~1 kW from the two-step
+    annual_power_density -> power_kw chain.
+
+    Parameters:
+    -----------
+    wind_speed : float or array_like
+        Mean wind speed(s) in m/s.
+    air_density : float, optional
+        Air density in kg/m³, default 0.990 (value at 200 m altitude).
+    energy_pattern_factor : float, optional
+        Default is 1.91 (Rayleigh distribution, Weibull k=2).
+    diameter : float, optional
+        Rotor diameter in meters, default 236 (Vestas V236).
+    dtype : numpy dtype, optional
+        Working precision for array inputs, default np.float32 (see
+        annual_power_density). Scalar inputs always compute in float64.
+    params : WindParams, optional
+        If given, air_density and energy_pattern_factor are taken from
+        the bundle instead of the individual keyword arguments.
+
+    Returns:
+    --------
+    int or np.ndarray
+        Power output in kW, rounded to nearest integer.
+    """
+    if params is not None:
+        air_density = params.air_density
+        energy_pattern_factor = params.energy_pattern_factor
+    if _np_ndim(wind_speed) == 0:
+        v = float(wind_speed)
+        return round(_TURBINE_KW_CONST * air_density * energy_pattern_factor
+                     * v * v * v * diameter * diameter)
+    v = _np_asarray(wind_speed, dtype=dtype)
+    return _np_rint(_TURBINE_KW_CONST * air_density * energy_pattern_factor
+                   * v * v * v * diameter * diameter)
+
+
+@njit(cache=True, fastmath=True)
+def _derated_aeo_scalar(power_kw: float, efficiency: float, _round: bool) -> float:
+    """JIT-compiled scalar kernel for derated_annual_energy_output."""
+    annual_energy_mwh = power_kw * (_MWH_PER_KW_YEAR * efficiency)
+    if _round:
+        return np.rint(annual_energy_mwh)
+    return annual_energy_mwh
+
+def derated_annual_energy_output(power_kw, efficiency: float = 0.2, _round: bool = True):
     """
     Calculate the annual energy output in MWh/year from power (kW) and efficiency factor.
 
     Parameters:
     -----------
-    power_kw : float
+    power_kw : float or array_like
         Power output in kW (e.g., from power_kw function).
     efficiency : float, optional
         Efficiency factor (default 0.2 for 20% derating).
 
     Returns:
     --------
-    float
+    float or np.ndarray
         Annual energy output in MWh/year, rounded to nearest integer.
 
     Example:
@@ -107,15 +375,54 @@ def derated_annual_energy_output(power_kw: float, efficiency: float = 0.2) -> fl
     # Annual energy = 2308 kW * 8760 h/year * 0.2 / 1000 = 4035.8 MWh/year
     # Rounded to nearest integer: 4036 MWh/year
     """
-    annual_energy_mwh = power_kw * 8760 * efficiency / 1000
-    return np.rint(annual_energy_mwh)
+    if _np_ndim(power_kw) == 0:
+        return _derated_aeo_scalar(float(power_kw), efficiency, _round)
+    annual_energy_mwh = _np_asarray(power_kw) * (_MWH_PER_KW_YEAR * efficiency)
+    if _round:
+        return _np_rint(annual_energy_mwh)
+    return annual_energy_mwh
 
-def annual_energy_output(power_kw_val):
+def annual_energy_output(power_kw_val, _round: bool = True):
     """
     Calculate the non-derated annual energy output in MWh/year from power (kW).
+
+    Scalar inputs return a plain Python int (builtin round, no NumPy
+    scalar allocation); array inputs are rounded in one vectorized pass.
+    Pass _round=False to skip the rounding (see pipeline).
+    """
+    annual_energy_mwh = power_kw_val * _MWH_PER_KW_YEAR
+    if not _round:
+        return annual_energy_mwh
+    if _np_ndim(annual_energy_mwh) == 0:
+        return round(annual_energy_mwh)
+    return _np_rint(annual_energy_mwh)
+
+def pipeline(wind_speed, air_density: float = 0.990, energy_pattern_factor: float = 1.91, diameter: float = 236.0, efficiency: float = 0.2, params: WindParams = None):
+    """
+    Full chain wind speed -> derated annual energy output (MWh/year),
+    rounding once at the end.
+
+    The step-by-step API rounds after every stage, which both biases the
+    result and (for arrays) costs a full extra pass per stage. Here each
+    stage runs with _round=False and only the final energy is rounded,
+    so results can differ by a few MWh/year from the composed rounded
+    calls.
+
+    Parameters mirror annual_power_density / power_kw /
+    derated_annual_energy_output; wind_speed may be a scalar or array.
+    A WindParams bundle may be passed instead of the individual
+    air_density / energy_pattern_factor / efficiency arguments.
     """
-    annual_energy_mwh = power_kw_val * 8760 / 1000
-    return np.rint(annual_energy_mwh)
+    if params is not None:
+        air_density = params.air_density
+        energy_pattern_factor = params.energy_pattern_factor
+        efficiency = params.efficiency
+    apd = annual_power_density(wind_speed, air_density, energy_pattern_factor, _round=False)
+    power = apd * swept_area(diameter) / 1000
+    energy = derated_annual_energy_output(power, efficiency, _round=False)
+    if _np_ndim(energy) == 0:
+        return round(energy)
+    return _np_rint(energy)
 
 def possible_turbine_installations(available_area_km2: float, rotor_diameter_m: float, spacing_factor: float) -> int:
     """
@@ -146,7 +453,108 @@ def possible_turbine_installations(available_area_km2: float, rotor_diameter_m:
     # Turbine Spacing Density = (6 * 50)^2 = 90,000 m²
     # Nturb = 1,000,000 / 90,000 = 11.11 -> 11 turbines (rounded down)
     """
-    available_area_m2 = available_area_km2 * 1_000_000
-    spacing_density = (spacing_factor * rotor_diameter_m) ** 2
-    nturb = available_area_m2 // spacing_density
-    return int(nturb)
+    # Integer floor-div: one IDIV, and no float rounding surprises when
+    # the area is an exact multiple of the spacing density
+    area_m2 = int(available_area_km2 * 1_000_000.0)
+    sd = spacing_factor * rotor_diameter_m
+    return area_m2 // int(sd * sd)
+
+def make_turbine_counter(rotor_diameter_m: float, spacing_factor: float = 5.98):
+    """
+    Build a fast turbine counter for a fixed (diameter, spacing) pair.
+
+    In grid sweeps that vary the area inside a loop, the spacing density
+    is loop-invariant. The returned callable captures the precomputed
+    integer denominator, so each call is one multiply and one integer
+    floor-division — the same arithmetic as
+    possible_turbine_installations, so counts agree exactly.
+
+    Parameters:
+    -----------
+    rotor_diameter_m : float
+        Turbine rotor diameter in meters (m).
+    spacing_factor : float, optional
+        Turbine density factor, default 5.98 (von Krauland et al.).
+
+    Returns:
+    --------
+    callable
+        count(available_area_km2: float) -> int, matching
+        possible_turbine_installations for the captured pair.
+    """
+    sd = spacing_factor * rotor_diameter_m
+    denom = int(sd * sd)
+
+    def count(available_area_km2: float) -> int:
+        return int(available_area_km2 * 1_000_000.0) // denom
+
+    return count
+
+def possible_turbine_installations_array(available_area_km2, rotor_diameter_m, spacing_factor):
+    """
+    Vectorized possible_turbine_installations for farm-siting grids.
+
+    All three arguments broadcast against each other, so an entire
+    (area x diameter x spacing) sweep resolves in one NumPy call.
+
+    Parameters:
+    -----------
+    available_area_km2 : array_like
+        Total available area(s) in square kilometers (km²).
+    rotor_diameter_m : array_like
+        Turbine rotor diameter(s) in meters (m).
+    spacing_factor : array_like
+        Turbine density factor(s).
+
+    Returns:
+    --------
+    np.ndarray
+        Number of possible wind turbine installations per grid point
+        (rounded down), dtype int64.
+    """
+    available_area_km2 = _np_asarray(available_area_km2, dtype=np.float64)
+    sd = _np_asarray(spacing_factor, dtype=np.float64) * rotor_diameter_m
+    # Truncate numerator and denominator exactly as the scalar function
+    # does, so all entry points agree on every triple
+    area_m2 = np.trunc(available_area_km2 * 1_000_000.0)
+    return np.floor_divide(area_m2, np.trunc(sd * sd)).astype(np.int64)
+
+@njit(parallel=True, cache=True)
+def _turbines_grid_kernel(areas, diameters, spacings, out):
+    """Parallel kernel for possible_turbines_grid (prange over areas)."""
+    for i in prange(areas.size):
+        for j in range(diameters.size):
+            for k in range(spacings.size):
+                # Same truncated-integer arithmetic as the scalar function
+                sd = spacings[k] * diameters[j]
+                out[i, j, k] = int(areas[i] * 1_000_000.0) // int(sd * sd)
+
+def possible_turbines_grid(available_area_km2, rotor_diameter_m, spacing_factor):
+    """
+    Turbine counts over a full (area x diameter x spacing) lattice.
+
+    Each lattice point is independent, so the compiled kernel splits the
+    area axis across cores with prange; without numba it degrades to the
+    same plain-Python loops.
+
+    Parameters:
+    -----------
+    available_area_km2 : array_like
+        Available areas in square kilometers (km²).
+    rotor_diameter_m : array_like
+        Rotor diameters in meters (m).
+    spacing_factor : array_like
+        Turbine density factors.
+
+    Returns:
+    --------
+    np.ndarray
+        Turbine counts with shape (n_areas, n_diameters, n_spacings),
+        dtype int64.
+    """
+    areas = np.ascontiguousarray(available_area_km2, dtype=np.float64)
+    diameters = np.ascontiguousarray(rotor_diameter_m, dtype=np.float64)
+    spacings = np.ascontiguousarray(spacing_factor, dtype=np.float64)
+    out = np.empty((areas.size, diameters.size, spacings.size), dtype=np.int64)
+    _turbines_grid_kernel(areas, diameters, spacings, out)
+    return out
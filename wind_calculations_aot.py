@@ -0,0 +1,38 @@
+"""
+Ahead-of-time build of the hot wind_calculations kernels.
+
+The njit kernels in wind_calculations.py compile on first call, which
+adds noticeable latency in short-lived processes (serverless, CLI runs).
+Running this script compiles the same kernels into a _wind_kernels
+extension module:
+
+    python wind_calculations_aot.py
+
+wind_calculations.py picks the compiled module up automatically when it
+is importable and falls back to JIT (or plain Python) otherwise. The
+kernel bodies must stay in sync with their twins in wind_calculations.py.
+"""
+import numpy as np
+from numba.pycc import CC
+
+cc = CC('_wind_kernels')
+
+
+@cc.export('apd_scalar', 'f8(f8, f8, f8)')
+def apd_scalar(wind_speed, air_density, energy_pattern_factor):
+    v2 = wind_speed * wind_speed
+    power_density = 0.5 * air_density * energy_pattern_factor * v2 * wind_speed
+    return np.rint(power_density)
+
+
+@cc.export('apd_array', 'f8[:](f8[:], f8, f8)')
+def apd_array(wind_speed, air_density, energy_pattern_factor):
+    out = np.empty_like(wind_speed)
+    for i in range(wind_speed.size):
+        v = wind_speed[i]
+        out[i] = np.rint(0.5 * air_density * energy_pattern_factor * v * v * v)
+    return out
+
+
+if __name__ == '__main__':
+    cc.compile()